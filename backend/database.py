@@ -2,52 +2,225 @@
 Database models and setup for Disk Intelligence snapshots.
 """
 
-from sqlalchemy import create_engine, Column, String, Integer, Text, DateTime
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, func, insert, Index, String, Integer, LargeBinary, DateTime
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+from sqlalchemy.pool import QueuePool
 from datetime import datetime
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Optional
 import json
 
+# orjson is a C extension that serializes/parses JSON several times faster than
+# stdlib json. Fall back to stdlib so the module still imports without it.
+try:
+    import orjson
+
+    def _json_dumps(obj, default=None) -> str:
+        # Text columns want str; orjson emits UTF-8 bytes
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS, default=default
+        ).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj, default=None) -> str:
+        return json.dumps(obj, default=default)
+
+    _json_loads = json.loads
+
+# msgpack packs the payload columns as compact binary instead of JSON text:
+# no string escaping, roughly half the size for numeric-heavy findings, and a
+# much faster decode. Optional — without it payloads are stored as JSON bytes.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# zstd squeezes the packed payloads further before they hit disk; level 3
+# roughly halves findings/comparison blobs at negligible CPU cost. Optional.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"  # zstd frame header
+_COMPRESS_MIN_BYTES = 4096  # don't bother compressing tiny payloads
+
+
+def _model_default(obj):
+    """Serializer hook: dump Pydantic models in-stream, one pass per model."""
+    dump = getattr(obj, "model_dump", None)
+    if dump is not None:
+        return dump()
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def _pack(obj) -> bytes:
+    """Serialize (and compress, when worthwhile) a payload for storage."""
+    if msgpack is not None:
+        data = msgpack.packb(obj, use_bin_type=True, default=_model_default)
+    else:
+        data = _json_dumps(obj, default=_model_default).encode("utf-8")
+    if zstandard is not None and len(data) >= _COMPRESS_MIN_BYTES:
+        data = zstandard.compress(data, 3)
+    return data
+
+
+def _unpack(data):
+    """Deserialize a stored payload, tolerating legacy JSON TEXT rows."""
+    if isinstance(data, str):
+        # Row predates the binary format
+        return _json_loads(data)
+    if data[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError(
+                "Snapshot payload is zstd-compressed but zstandard is not installed"
+            )
+        data = zstandard.decompress(data)
+    # JSON bytes start with '{' or '[' (possibly after whitespace); msgpack
+    # for our payloads (dicts/lists) never does
+    if data[:1] in (b"{", b"[") or data[:1].isspace():
+        return _json_loads(data)
+    if msgpack is None:
+        raise RuntimeError(
+            "Snapshot payload is msgpack-encoded but msgpack is not installed"
+        )
+    return msgpack.unpackb(data, raw=False)
+
 # SQLite database file
 DATABASE_URL = "sqlite:///./disk_intelligence.db"
 
+# Keep a small pool of long-lived connections instead of reopening the
+# database file (and rewarming its page cache) on every get_db() call.
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_recycle=-1,  # never age out idle connections
+    query_cache_size=500,  # keep compiled statements hot across requests
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+
+@event.listens_for(engine, "connect")
+def _tune_sqlite_connection(dbapi_connection, connection_record):
+    """Apply performance PRAGMAs to every new SQLite connection.
+
+    WAL lets readers run concurrently with the single writer, and
+    synchronous=NORMAL halves the fsyncs per commit (still durable in WAL
+    mode short of power loss). The rest sizes the page cache/mmap for the
+    large snapshot blobs this table stores.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+# Separate engine for read-only endpoints: connections open the file with
+# mode=ro, so they can never queue behind the writer lock and SQLite skips
+# journal bookkeeping for them entirely.
+RO_DATABASE_URL = "sqlite:///file:disk_intelligence.db?mode=ro&uri=true"
+
+ro_engine = create_engine(
+    RO_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=4,
+    max_overflow=8,
+    pool_recycle=-1,
+    query_cache_size=500,
+)
+ReadSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=ro_engine
+)
+
+
+@event.listens_for(ro_engine, "connect")
+def _tune_sqlite_ro_connection(dbapi_connection, connection_record):
+    """Read-side PRAGMAs only — no journal changes on a read-only handle."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+class Base(DeclarativeBase):
+    pass
 
 # ============================================================================
 # Database Models
 # ============================================================================
 
 class SnapshotDB(Base):
-    """Database model for scan snapshots."""
+    """Hot snapshot metadata: small scalars only, cheap to scan and list.
+
+    The large packed payloads live in SnapshotPayloadDB so that listing
+    and ordering snapshots never touches multi-MB blob overflow pages.
+    """
     __tablename__ = "snapshots"
 
-    id = Column(String, primary_key=True, index=True)
-    scan_id = Column(String, nullable=False)
-    root_path = Column(String, nullable=False, index=True)
-    findings_json = Column(Text, nullable=False)  # JSON serialized findings
-    extensions_json = Column(Text, nullable=False)  # JSON serialized extensions
-    scan_info_json = Column(Text, nullable=False)  # JSON serialized scan info
-    saved_at = Column(DateTime, default=datetime.utcnow)
+    id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    scan_id: Mapped[str] = mapped_column(String, nullable=False)
+    root_path: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # Written by SQLite itself so inserts skip a Python-side timestamp and
+    # its type-coercion roundtrip
+    saved_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.current_timestamp(), nullable=False
+    )
 
     # Metadata fields for quick display
-    total_files = Column(Integer)
-    total_folders = Column(Integer)
-    total_size_bytes = Column(Integer)
+    total_files: Mapped[Optional[int]] = mapped_column(Integer)
+    total_folders: Mapped[Optional[int]] = mapped_column(Integer)
+    total_size_bytes: Mapped[Optional[int]] = mapped_column(Integer)
 
     # Comparison snapshot fields
-    snapshot_type = Column(String, default="scan")  # "scan" or "comparison"
-    target_path = Column(String, nullable=True)  # Only for comparisons
-    comparison_json = Column(Text, nullable=True)  # Comparison tree data
-    comparison_summary_json = Column(Text, nullable=True)  # Summary counts
+    snapshot_type: Mapped[Optional[str]] = mapped_column(String, default="scan")  # "scan" or "comparison"
+    target_path: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # Only for comparisons
+
+    # Serve "recent snapshots by type" from the index B-tree instead of a
+    # full table scan
+    __table_args__ = (
+        Index("ix_snapshots_type_saved_at", "snapshot_type", "saved_at"),
+    )
+
+
+class SnapshotPayloadDB(Base):
+    """Cold snapshot payloads: the packed findings/extensions/comparison
+    blobs, keyed 1:1 to SnapshotDB."""
+    __tablename__ = "snapshot_payloads"
+
+    snapshot_id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    findings: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    extensions: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    scan_info: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    comparison: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    comparison_summary: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+
+
+class HashCacheDB(Base):
+    """Persistent content-digest cache for deep comparisons.
+
+    Rows are keyed by absolute path and validated against the
+    (size, mtime_ns) fingerprint; a file whose fingerprint is unchanged
+    reuses its stored digests instead of being re-read and re-hashed on
+    every comparison run.
+    """
+    __tablename__ = "hash_cache"
+
+    path: Mapped[str] = mapped_column(String, primary_key=True)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    mtime_ns: Mapped[int] = mapped_column(Integer, nullable=False)
+    prefix_hash: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    full_hash: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
 
 def migrate_database():
     """Add missing columns to existing database for backwards compatibility."""
@@ -61,8 +234,6 @@ def migrate_database():
         migrations = [
             ("snapshot_type", "VARCHAR DEFAULT 'scan'"),
             ("target_path", "VARCHAR"),
-            ("comparison_json", "TEXT"),
-            ("comparison_summary_json", "TEXT"),
         ]
 
         for column_name, column_def in migrations:
@@ -74,22 +245,106 @@ def migrate_database():
                 except Exception as e:
                     print(f"Column {column_name} may already exist: {e}")
 
-# Run migrations on import
-migrate_database()
+        # Move payload blobs out of the snapshots table into
+        # snapshot_payloads (one-time copy for databases that predate the
+        # hot/cold split), then drop the old wide columns
+        if "findings_json" in existing_columns:
+            try:
+                # Databases old enough to predate comparisons lack those
+                # columns entirely
+                select_parts = [
+                    col if col in existing_columns else "NULL"
+                    for col in (
+                        "findings_json",
+                        "extensions_json",
+                        "scan_info_json",
+                        "comparison_json",
+                        "comparison_summary_json",
+                    )
+                ]
+                conn.execute(text(
+                    "INSERT OR IGNORE INTO snapshot_payloads "
+                    "(snapshot_id, findings, extensions, scan_info, "
+                    " comparison, comparison_summary) "
+                    f"SELECT id, {', '.join(select_parts)} FROM snapshots"
+                ))
+                conn.commit()
+                for old_column in (
+                    "findings_json",
+                    "extensions_json",
+                    "scan_info_json",
+                    "comparison_json",
+                    "comparison_summary_json",
+                ):
+                    if old_column in existing_columns:
+                        conn.execute(text(
+                            f"ALTER TABLE snapshots DROP COLUMN {old_column}"
+                        ))
+                conn.commit()
+                print("Migrated snapshot payloads to snapshot_payloads")
+            except Exception as e:
+                print(f"Payload migration failed: {e}")
+
+        # Index for list queries on existing databases; ANALYZE so the
+        # planner actually picks it up
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_snapshots_type_saved_at "
+            "ON snapshots (snapshot_type, saved_at)"
+        ))
+        conn.execute(text("ANALYZE"))
+        conn.commit()
+
+def init_db():
+    """Create tables and run migrations. Called once at app startup so a
+    plain `import database` stays free of schema roundtrips."""
+    from sqlalchemy import inspect, text
+
+    # Incremental autovacuum must be chosen before the first table exists;
+    # the VACUUM rewrites the (still empty) file so the setting takes hold.
+    # On databases that already have tables this whole block is skipped.
+    if not inspect(engine).has_table("snapshots"):
+        with engine.connect() as conn:
+            conn.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+            conn.execute(text("VACUUM"))
+    Base.metadata.create_all(bind=engine)
+    migrate_database()
+
+# How often the background maintenance task runs
+MAINTENANCE_INTERVAL_SECONDS = 3600
+
+def run_maintenance():
+    """Refresh planner stats and reclaim freed pages.
+
+    Runs from a periodic background task instead of on every connection
+    close, so the request path never pays for it.
+    """
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        conn.execute(text("PRAGMA optimize"))
+        conn.execute(text("PRAGMA incremental_vacuum(1000)"))
 
 # ============================================================================
 # Database helper functions
 # ============================================================================
 
 def get_db():
-    """Get database session."""
+    """Get a read-write database session."""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
-def serialize_snapshot(
+def get_db_ro():
+    """Get a read-only database session for GET endpoints."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def snapshot_rows(
     snapshot_id: str,
     scan_id: str,
     root_path: str,
@@ -100,45 +355,109 @@ def serialize_snapshot(
     target_path: str = None,
     comparison_data: list = None,
     comparison_summary: dict = None
-) -> SnapshotDB:
-    """Create a SnapshotDB instance from scan data."""
-    return SnapshotDB(
+) -> tuple:
+    """Build (metadata row, payload row) column dicts for a snapshot."""
+    # Normalize scan_info to a dict once instead of branching per field
+    si = scan_info if isinstance(scan_info, dict) else scan_info.model_dump()
+    meta = dict(
         id=snapshot_id,
         scan_id=scan_id,
         root_path=root_path,
-        findings_json=json.dumps([f.dict() if hasattr(f, 'dict') else f for f in findings]),
-        extensions_json=json.dumps([e.dict() if hasattr(e, 'dict') else e for e in extensions]),
-        scan_info_json=json.dumps(scan_info.dict() if hasattr(scan_info, 'dict') else scan_info),
-        total_files=scan_info.get('total_files') if isinstance(scan_info, dict) else scan_info.total_files,
-        total_folders=scan_info.get('total_folders') if isinstance(scan_info, dict) else scan_info.total_folders,
-        total_size_bytes=scan_info.get('total_size_bytes') if isinstance(scan_info, dict) else scan_info.total_size_bytes,
-        saved_at=datetime.utcnow(),
+        total_files=si.get("total_files"),
+        total_folders=si.get("total_folders"),
+        total_size_bytes=si.get("total_size_bytes"),
         snapshot_type=snapshot_type,
         target_path=target_path,
-        comparison_json=json.dumps(comparison_data) if comparison_data else None,
-        comparison_summary_json=json.dumps(comparison_summary) if comparison_summary else None
     )
+    payload = dict(
+        snapshot_id=snapshot_id,
+        findings=_pack(findings),
+        extensions=_pack(extensions),
+        scan_info=_pack(si),
+        comparison=_pack(comparison_data) if comparison_data else None,
+        comparison_summary=_pack(comparison_summary) if comparison_summary else None,
+    )
+    return meta, payload
+
+# Chunk bulk inserts so a batch of blob rows never approaches SQLite's
+# bound-variable limit
+BULK_INSERT_CHUNK = 500
+
+def insert_snapshot_rows(db, rows: list):
+    """Insert (meta, payload) row pairs via executemany, one commit."""
+    metas = [meta for meta, _ in rows]
+    payloads = [payload for _, payload in rows]
+    for start in range(0, len(rows), BULK_INSERT_CHUNK):
+        db.execute(insert(SnapshotDB), metas[start:start + BULK_INSERT_CHUNK])
+        db.execute(insert(SnapshotPayloadDB), payloads[start:start + BULK_INSERT_CHUNK])
+    db.commit()
 
-def deserialize_snapshot(snapshot_db: SnapshotDB) -> dict:
-    """Convert SnapshotDB to a dictionary for API response."""
-    result = {
-        "id": snapshot_db.id,
-        "scan_id": snapshot_db.scan_id,
-        "root_path": snapshot_db.root_path,
-        "findings": json.loads(snapshot_db.findings_json),
-        "extensions": json.loads(snapshot_db.extensions_json),
-        "scan_info": json.loads(snapshot_db.scan_info_json),
-        "saved_at": snapshot_db.saved_at.isoformat(),
-        "total_files": snapshot_db.total_files,
-        "total_folders": snapshot_db.total_folders,
-        "total_size_bytes": snapshot_db.total_size_bytes,
-        "snapshot_type": snapshot_db.snapshot_type or "scan",
-        "target_path": snapshot_db.target_path,
+# Bounded LRU of parsed payloads. Snapshots are immutable for a given
+# saved_at, so (id, saved_at) keys stay valid; updates change saved_at and
+# naturally miss. Entries are treated as read-only by callers.
+_PARSE_CACHE: OrderedDict = OrderedDict()
+_PARSE_CACHE_MAX = 128
+
+
+def _parse_payload(key, payload_db: SnapshotPayloadDB, include_comparison: bool) -> dict:
+    """Unpack a payload row, memoized on (snapshot id, saved_at)."""
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        _PARSE_CACHE.move_to_end(key)
+        return cached
+
+    parsed = {
+        "findings": _unpack(payload_db.findings) if payload_db.findings else [],
+        "extensions": _unpack(payload_db.extensions) if payload_db.extensions else [],
+        "scan_info": _unpack(payload_db.scan_info) if payload_db.scan_info else {},
     }
+    if include_comparison and payload_db.comparison:
+        parsed["comparison"] = _unpack(payload_db.comparison)
+    if payload_db.comparison_summary:
+        parsed["comparison_summary"] = _unpack(payload_db.comparison_summary)
+
+    _PARSE_CACHE[key] = parsed
+    if len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+        _PARSE_CACHE.popitem(last=False)
+    return parsed
+
+
+# Envelope template compiled once at import: attrgetter fetches all scalar
+# columns in a single C-level call instead of nine Python attribute lookups
+# per row, which adds up when a list endpoint deserializes dozens of snapshots.
+_SCALAR_KEYS = (
+    "id", "scan_id", "root_path", "saved_at",
+    "total_files", "total_folders", "total_size_bytes",
+    "snapshot_type", "target_path",
+)
+_SCALAR_GETTER = attrgetter(*_SCALAR_KEYS)
+
+
+def deserialize_snapshot(
+    snapshot_db: SnapshotDB,
+    payload_db: SnapshotPayloadDB = None,
+    include_comparison: bool = True,
+) -> dict:
+    """Convert a (metadata, payload) row pair to a dict for API response.
+
+    Pass include_comparison=False for list views so the (potentially huge)
+    comparison tree column is never read or decoded.
+    """
+    result = dict(zip(_SCALAR_KEYS, _SCALAR_GETTER(snapshot_db)))
+    saved_at = result["saved_at"]
+    # Freshly built (not yet reloaded) rows rely on the server default,
+    # so saved_at may not be populated on the Python side yet
+    result["saved_at"] = (
+        saved_at.isoformat() if saved_at is not None
+        else datetime.utcnow().isoformat()
+    )
+    result["snapshot_type"] = result["snapshot_type"] or "scan"
+    result["findings"] = []
+    result["extensions"] = []
+    result["scan_info"] = {}
 
-    if snapshot_db.comparison_json:
-        result["comparison"] = json.loads(snapshot_db.comparison_json)
-    if snapshot_db.comparison_summary_json:
-        result["comparison_summary"] = json.loads(snapshot_db.comparison_summary_json)
+    if payload_db is not None:
+        key = (snapshot_db.id, snapshot_db.saved_at, include_comparison)
+        result.update(_parse_payload(key, payload_db, include_comparison))
 
     return result